@@ -1,12 +1,23 @@
 """Anthropic blog/news scraper service using RSS feeds."""
 
+import asyncio
+import calendar
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
 
 import feedparser  # pyright: ignore[reportMissingImports]
-import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
 from pydantic import BaseModel, Field  # pyright: ignore[reportMissingImports]
 
+from app.scrapers.cache import CACHE_DIR, SQLiteCache, get_feed_cache, parse_feed
+from app.scrapers.session import create_session
+
+logger = logging.getLogger(__name__)
+
 try:
     from docling.document_converter import DocumentConverter  # pyright: ignore[reportMissingImports]
     DOCLING_AVAILABLE = True
@@ -14,6 +25,30 @@ except ImportError:
     DOCLING_AVAILABLE = False
     DocumentConverter = None  # type: ignore
 
+# Docling's converter is expensive to build, so one instance is created lazily and shared.
+# A failed build is remembered so it is attempted only once per process
+_CONVERTER: Optional["DocumentConverter"] = None
+_CONVERTER_FAILED = False
+_CONVERTER_LOCK = threading.Lock()
+
+# Sort key for articles without a date, so they order after dated ones
+_MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _get_converter() -> Optional["DocumentConverter"]:
+    """Return the process-wide docling converter, creating it on first use."""
+    global _CONVERTER, _CONVERTER_FAILED
+    if _CONVERTER is None and DOCLING_AVAILABLE and not _CONVERTER_FAILED:
+        with _CONVERTER_LOCK:
+            if _CONVERTER is None and not _CONVERTER_FAILED:
+                try:
+                    _CONVERTER = DocumentConverter()
+                except Exception as e:
+                    _CONVERTER_FAILED = True
+                    logger.warning("Failed to initialize docling converter: %s", e)
+    return _CONVERTER
+
+
 class AnthropicArticle(BaseModel):
     """Model for Anthropic blog article."""
     
@@ -35,63 +70,114 @@ class AnthropicScraper:
         "research": "https://raw.githubusercontent.com/Olshansk/rss-feeds/main/feeds/feed_anthropic_research.xml",
     }
     
+    # Concurrent docling conversions; kept low to avoid triggering anti-bot throttling
+    MARKDOWN_MAX_WORKERS = 4
+    
+    # Published article pages rarely change, so converted markdown is kept for 30 days
+    MARKDOWN_CACHE_TTL = 30 * 24 * 60 * 60
+    
     def __init__(self):
         """Initialize the Anthropic scraper."""
-        self._docling_converter = None
-        if DOCLING_AVAILABLE:
-            try:
-                # Initialize docling converter
-                self._docling_converter = DocumentConverter()
-            except Exception as e:
-                print(f"Warning: Failed to initialize docling converter: {e}")
-                self._docling_converter = None
+        # Shared session so feeds fetched in parallel reuse pooled connections
+        self._session = create_session()
+        self._feed_cache = get_feed_cache()
+        self._markdown_cache = SQLiteCache(CACHE_DIR / "markdown.sqlite")
     
     def fetch_rss_feed(self, feed_url: str) -> feedparser.FeedParserDict:
-        """Fetch and parse a single RSS feed."""
-        response = requests.get(feed_url, timeout=10)
-        response.raise_for_status()
-        return feedparser.parse(response.content)
+        """Fetch and parse a single RSS feed, revalidating a cached copy when available."""
+        cached = self._feed_cache.fetch(feed_url, session=self._session, timeout=10)
+        return parse_feed(cached.content)
+    
+    async def fetch_rss_feed_async(self, feed_url: str) -> feedparser.FeedParserDict:
+        """Fetch and parse a single RSS feed without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_rss_feed, feed_url)
     
     def _parse_published_date(self, entry) -> Optional[datetime]:
         """Parse published date from RSS feed entry."""
         try:
             # Try published_parsed first (most reliable)
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                dt = datetime(*entry.published_parsed[:6])
+            published_parsed = entry.get('published_parsed')
+            if published_parsed:
+                dt = datetime(*published_parsed[:6])
                 dt = dt.replace(tzinfo=timezone.utc)
                 return dt
             
             # Fallback to updated_parsed
-            if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                dt = datetime(*entry.updated_parsed[:6])
+            updated_parsed = entry.get('updated_parsed')
+            if updated_parsed:
+                dt = datetime(*updated_parsed[:6])
                 dt = dt.replace(tzinfo=timezone.utc)
                 return dt
             
-            # Try parsing published string directly using feedparser's parse function
-            if hasattr(entry, 'published') and entry.published:
+            # Try parsing the published string directly as an RFC 2822 date
+            published = entry.get('published')
+            if published:
                 try:
-                    # Re-parse just the date string
-                    temp_feed = feedparser.parse(f'<rss><channel><item><pubDate>{entry.published}</pubDate></item></channel></rss>')
-                    if temp_feed.entries and hasattr(temp_feed.entries[0], 'published_parsed'):
-                        parsed = temp_feed.entries[0].published_parsed
-                        if parsed:
-                            dt = datetime(*parsed[:6])
-                            dt = dt.replace(tzinfo=timezone.utc)
-                            return dt
-                except Exception:
+                    dt = parsedate_to_datetime(published)
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=timezone.utc)
+                    return dt.astimezone(timezone.utc)
+                except (TypeError, ValueError):
                     pass
             
             return None
         except Exception as e:
             # Log parsing errors for debugging
-            print(f"Warning: Failed to parse date for entry: {e}")
+            logger.warning("Failed to parse date for entry: %s", e, exc_info=True)
             return None
     
+    def _fetch_feeds(self, feed_names: List[str]) -> Dict[str, feedparser.FeedParserDict]:
+        """
+        Fetch several RSS feeds concurrently.
+        
+        Args:
+            feed_names: Names of feeds in RSS_FEEDS to fetch
+            
+        Returns:
+            Dictionary mapping feed name to parsed feed. Feeds that failed to fetch are omitted.
+        """
+        fetched = {}
+        if not feed_names:
+            return fetched
+        
+        with ThreadPoolExecutor(max_workers=len(feed_names)) as executor:
+            futures = {
+                executor.submit(self.fetch_rss_feed, self.RSS_FEEDS[name]): name
+                for name in feed_names
+            }
+            for future in as_completed(futures):
+                feed_name = futures[future]
+                try:
+                    fetched[feed_name] = future.result()
+                except Exception as e:
+                    # Log error but continue with other feeds
+                    logger.error("Error fetching %s feed: %s", feed_name, e)
+        
+        return fetched
+    
+    def _published_timestamp(self, entry) -> Optional[float]:
+        """
+        Return the entry's publication time as a UTC Unix timestamp, or None if unknown.
+        
+        feedparser's struct_time values are already UTC, so calendar.timegm converts them
+        without building a datetime for entries that are about to be filtered out.
+        """
+        try:
+            parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            if parsed:
+                return calendar.timegm(parsed)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        
+        published_date = self._parse_published_date(entry)
+        return published_date.timestamp() if published_date else None
+    
     def get_articles(
         self, 
         hours: int = 24,
         feeds: Optional[List[str]] = None,
-        max_articles_without_date: int = 10
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
     ) -> List[AnthropicArticle]:
         """
         Get articles from Anthropic RSS feeds within the specified time window.
@@ -102,100 +188,162 @@ class AnthropicScraper:
                    Options: 'news', 'engineering', 'research'
             max_articles_without_date: Maximum number of articles without dates to include
                                       (RSS feeds show recent first, so limit to avoid old articles)
+            limit: Maximum number of articles to return, most recent first (default: all)
             
         Returns:
             List of AnthropicArticle models within the time window, sorted by date
         """
-        if feeds is None:
-            feeds = list(self.RSS_FEEDS.keys())
+        feed_names = self._resolve_feed_names(feeds)
+        fetched_feeds = self._fetch_feeds(feed_names)
+        return self._collect_articles(feed_names, fetched_feeds, hours, max_articles_without_date, limit)
+    
+    async def get_articles_async(
+        self,
+        hours: int = 24,
+        feeds: Optional[List[str]] = None,
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
+    ) -> List[AnthropicArticle]:
+        """
+        Async variant of get_articles that fetches all feeds concurrently with asyncio.
         
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        Args:
+            hours: Number of hours to look back (default: 24)
+            feeds: List of feed names to fetch from. If None, fetches from all feeds.
+            max_articles_without_date: Maximum number of articles without dates to include
+            limit: Maximum number of articles to return, most recent first (default: all)
+            
+        Returns:
+            List of AnthropicArticle models within the time window, sorted by date
+        """
+        feed_names = self._resolve_feed_names(feeds)
+        results = await asyncio.gather(
+            *(self.fetch_rss_feed_async(self.RSS_FEEDS[name]) for name in feed_names),
+            return_exceptions=True,
+        )
+        
+        fetched_feeds = {}
+        for feed_name, result in zip(feed_names, results):
+            if isinstance(result, Exception):
+                # Log error but continue with other feeds
+                logger.error("Error fetching %s feed: %s", feed_name, result)
+                continue
+            fetched_feeds[feed_name] = result
+        
+        return self._collect_articles(feed_names, fetched_feeds, hours, max_articles_without_date, limit)
+    
+    def _build_article(
+        self,
+        entry: feedparser.FeedParserDict,
+        feed_name: str,
+        published_date: Optional[datetime]
+    ) -> AnthropicArticle:
+        """
+        Build an article from a feed entry without re-running Pydantic validation.
+        
+        Fields are normalized to the model's types here, so model_construct is safe to use.
+        """
+        # Extract category from entry if available
+        category = ""
+        entry_category = entry.get('category')
+        if isinstance(entry_category, list) and len(entry_category) > 0:
+            category = str(entry_category[0])
+        elif isinstance(entry_category, str):
+            category = entry_category
+        
+        return AnthropicArticle.model_construct(
+            title=str(entry.title),
+            url=str(entry.link),
+            published_date=published_date,
+            description=entry.get('description') or '',
+            category=category,
+            source_feed=feed_name,
+            markdown_content=None,
+        )
+    
+    def _resolve_feed_names(self, feeds: Optional[List[str]]) -> List[str]:
+        """Return the requested feed names that exist in RSS_FEEDS (all feeds if None)."""
+        if feeds is None:
+            return list(self.RSS_FEEDS.keys())
+        return [name for name in feeds if name in self.RSS_FEEDS]
+    
+    def _collect_articles(
+        self,
+        feed_names: List[str],
+        fetched_feeds: Dict[str, feedparser.FeedParserDict],
+        hours: int,
+        max_articles_without_date: int,
+        limit: Optional[int] = None
+    ) -> List[AnthropicArticle]:
+        """Filter entries of already-fetched feeds by time and build sorted, de-duplicated articles."""
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=hours)
+        # Dates more than 1 day in the future are likely incorrect - they are kept rather than dropped
+        future_cutoff = now + timedelta(days=1)
+        # Compare plain timestamps in the entry loop; datetimes are only built for kept entries
+        cutoff_ts = cutoff_time.timestamp()
+        future_cutoff_ts = future_cutoff.timestamp()
         all_articles = []
         articles_without_date = []
+        # Same article might appear in multiple feeds - skip duplicates before building them
+        seen_urls: set[str] = set()
+        undated_urls: set[str] = set()
         
-        for feed_name in feeds:
-            if feed_name not in self.RSS_FEEDS:
+        # Process in the requested feed order so results don't depend on which fetch finished first
+        for feed_name in feed_names:
+            feed = fetched_feeds.get(feed_name)
+            if feed is None:
                 continue
             
-            feed_url = self.RSS_FEEDS[feed_name]
             try:
-                feed = self.fetch_rss_feed(feed_url)
-                
                 for entry in feed.entries:
-                    published_date = self._parse_published_date(entry)
+                    if entry.link in seen_urls:
+                        continue
                     
-                    # Filter by time if published_date is available and valid
-                    if published_date:
-                        now = datetime.now(timezone.utc)
+                    published_ts = self._published_timestamp(entry)
+                    
+                    # Filter by time if a publication time is available and valid
+                    if published_ts is not None:
                         # If date is more than 1 day in the future, it's likely incorrect - include it
-                        if published_date > now + timedelta(days=1):
+                        if published_ts > future_cutoff_ts:
                             # Future date, likely incorrect - treat as recent and include
                             pass
-                        elif published_date < cutoff_time:
+                        elif published_ts < cutoff_ts:
                             # Old article, skip it
                             continue
                     else:
                         # No date available - RSS feeds typically show recent articles first
-                        # We'll collect these separately and limit them
-                        articles_without_date.append((feed_name, entry))
+                        # We'll collect these separately, only up to the limit
+                        if (
+                            len(articles_without_date) < max_articles_without_date
+                            and entry.link not in undated_urls
+                        ):
+                            undated_urls.add(entry.link)
+                            articles_without_date.append((feed_name, entry))
                         continue
                     
-                    # Extract category from entry if available
-                    category = ""
-                    if hasattr(entry, 'category'):
-                        if isinstance(entry.category, list) and len(entry.category) > 0:
-                            category = entry.category[0]
-                        elif isinstance(entry.category, str):
-                            category = entry.category
-                    
-                    article = AnthropicArticle(
-                        title=entry.title,
-                        url=entry.link,
-                        published_date=published_date,
-                        description=getattr(entry, 'description', ''),
-                        category=category,
-                        source_feed=feed_name,
-                    )
-                    all_articles.append(article)
+                    published_date = datetime.fromtimestamp(published_ts, timezone.utc)
+                    seen_urls.add(entry.link)
+                    all_articles.append(self._build_article(entry, feed_name, published_date))
             except Exception as e:
                 # Log error but continue with other feeds
-                print(f"Error fetching {feed_name} feed: {e}")
+                logger.error("Error processing %s feed: %s", feed_name, e, exc_info=True)
                 continue
         
-        # Add articles without dates (limit to most recent ones)
-        for feed_name, entry in articles_without_date[:max_articles_without_date]:
-            category = ""
-            if hasattr(entry, 'category'):
-                if isinstance(entry.category, list) and len(entry.category) > 0:
-                    category = entry.category[0]
-                elif isinstance(entry.category, str):
-                    category = entry.category
-            
-            article = AnthropicArticle(
-                title=entry.title,
-                url=entry.link,
-                published_date=None,
-                description=getattr(entry, 'description', ''),
-                category=category,
-                source_feed=feed_name,
-            )
-            all_articles.append(article)
-        
-        # Remove duplicates based on URL (same article might appear in multiple feeds)
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
-                unique_articles.append(article)
+        # Add articles without dates, unless a later feed had the same article with a date
+        for feed_name, entry in articles_without_date:
+            if entry.link in seen_urls:
+                continue
+            seen_urls.add(entry.link)
+            all_articles.append(self._build_article(entry, feed_name, None))
         
         # Sort by published_date (most recent first)
-        unique_articles.sort(
-            key=lambda x: x.published_date or datetime.min.replace(tzinfo=timezone.utc), 
-            reverse=True
-        )
+        if limit is not None:
+            # Partial selection is O(n log k) instead of sorting everything
+            return heapq.nlargest(limit, all_articles, key=lambda x: x.published_date or _MIN_DT)
+        all_articles.sort(key=lambda x: x.published_date or _MIN_DT, reverse=True)
         
-        return unique_articles
+        return all_articles
     
     def convert_article_to_markdown(self, article: AnthropicArticle) -> Optional[str]:
         """
@@ -207,26 +355,39 @@ class AnthropicScraper:
         Returns:
             Markdown content as string, or None if conversion fails
         """
-        if not DOCLING_AVAILABLE or self._docling_converter is None:
-            print("Warning: docling is not available. Cannot convert to markdown.")
+        cache_key = self._markdown_cache_key(article)
+        cached = self._markdown_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        converter = _get_converter()
+        if converter is None:
+            logger.warning("docling is not available. Cannot convert to markdown.")
             return None
         
         try:
             # Use docling to convert the URL to a document
-            result = self._docling_converter.convert(article.url)
+            result = converter.convert(article.url)
             
             # Use export_to_markdown method to get markdown content
             if hasattr(result, 'document') and result.document:
                 markdown = result.document.export_to_markdown()
+                self._markdown_cache.set(cache_key, markdown, expire=self.MARKDOWN_CACHE_TTL)
                 return markdown
             else:
-                print(f"Warning: docling conversion did not return a document for {article.url}")
+                logger.warning("docling conversion did not return a document for %s", article.url)
                 return None
                 
         except Exception as e:
-            print(f"Error converting article '{article.title}' to markdown: {e}")
+            logger.error("Error converting article '%s' to markdown: %s", article.title, e)
             return None
     
+    def _markdown_cache_key(self, article: AnthropicArticle) -> str:
+        """Cache key for an article's markdown; a republished article gets a new key."""
+        if article.published_date is None:
+            return article.url
+        return f"{article.url}@{article.published_date.isoformat()}"
+    
     def get_articles_with_markdown(
         self,
         hours: int = 24,
@@ -246,11 +407,16 @@ class AnthropicScraper:
         """
         articles = self.get_articles(hours=hours, feeds=feeds)
         
-        if convert_to_markdown:
-            for article in articles:
-                markdown = self.convert_article_to_markdown(article)
-                if markdown:
-                    article.markdown_content = markdown
+        if convert_to_markdown and articles:
+            # Each conversion is a page fetch plus parse, so run them concurrently.
+            # docling guards its pipeline cache with a lock and creates a backend per
+            # document, so the one converter can be shared by the workers.
+            max_workers = min(self.MARKDOWN_MAX_WORKERS, len(articles))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                markdowns = executor.map(self.convert_article_to_markdown, articles)
+                for article, markdown in zip(articles, markdowns):
+                    if markdown:
+                        article.markdown_content = markdown
         
         return articles
 
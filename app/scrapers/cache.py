@@ -0,0 +1,235 @@
+"""On-disk caches and feed parsing helpers shared by the scrapers."""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+import feedparser  # pyright: ignore[reportMissingImports]
+import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
+from lxml import etree  # pyright: ignore[reportMissingImports]
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(
+    os.environ.get("AI_NEWS_AGGREGATOR_CACHE_DIR", "~/.cache/ai-news-aggregator")
+).expanduser()
+
+
+class CachedFeed(NamedTuple):
+    """Raw feed response kept for conditional re-fetching."""
+
+    content: bytes
+    etag: str
+    last_modified: str
+    fetched_at: float
+
+
+class FeedCache:
+    """
+    Cache of raw feed responses keyed by URL, persisted to disk with pickle.
+
+    Entries younger than ``ttl`` seconds are served without a request. Older entries are
+    revalidated with If-None-Match / If-Modified-Since, so an unchanged feed costs an
+    empty 304 response instead of a full download.
+    """
+
+    def __init__(self, path: Path, ttl: float = 15 * 60):
+        """
+        Initialize the cache and load any entries persisted by a previous run.
+
+        Args:
+            path: Pickle file the cache is persisted to
+            ttl: Seconds an entry is served without revalidation (default: 15 minutes)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CachedFeed] = self._load()
+
+    def _load(self) -> Dict[str, CachedFeed]:
+        """Load persisted entries, starting empty if the file is missing or unreadable."""
+        try:
+            with open(self.path, "rb") as f:
+                entries = pickle.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except Exception:
+            return {}
+
+    def _save(self) -> None:
+        """Atomically persist all entries. Must be called with the lock held."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to write feed cache %s: %s", self.path, e)
+
+    def fetch(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> CachedFeed:
+        """
+        Return the response for ``url``, using the cache and conditional GET where possible.
+
+        Args:
+            url: Feed URL to fetch
+            session: Session to issue the request with (default: a one-shot requests.get)
+            timeout: Request timeout in seconds (default: 10)
+            headers: Extra request headers
+
+        Returns:
+            CachedFeed with the raw response body and the headers needed to revalidate it
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails and nothing is cached
+                (with a cached copy, that copy is returned instead, however old)
+        """
+        with self._lock:
+            cached = self._entries.get(url)
+
+        if cached is not None and time.time() - cached.fetched_at < self.ttl:
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        http = session if session is not None else requests
+        try:
+            response = http.get(url, timeout=timeout, headers=request_headers)
+            if cached is None or response.status_code != 304:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if cached is None:
+                raise
+            logger.warning("Failed to revalidate %s, serving cached copy: %s", url, e)
+            return cached
+
+        if cached is not None and response.status_code == 304:
+            # Not modified - keep the cached body and restart its TTL
+            entry = cached._replace(fetched_at=time.time())
+        else:
+            entry = CachedFeed(
+                content=response.content,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                fetched_at=time.time(),
+            )
+
+        changed = cached is None or entry._replace(fetched_at=0) != cached._replace(fetched_at=0)
+        with self._lock:
+            self._entries[url] = entry
+            if changed:
+                # An unchanged feed only restarts its TTL in memory; rewriting the whole
+                # file for that would serialize concurrent fetches behind the lock
+                self._save()
+
+        return entry
+
+
+class SQLiteCache:
+    """
+    Persistent key/value text cache backed by SQLite, with optional per-entry expiry.
+
+    A connection is opened per operation, so one instance can be used from worker threads.
+    Storage errors are reported and treated as cache misses rather than raised.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the cache. The database file is created on first use.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, ensure the table exists, and commit on success."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache "
+                    "(key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+                )
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key``, or ``default`` if it is missing or expired.
+
+        A stored value may itself be None, so pass a sentinel ``default`` to tell the two apart.
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to read cache %s: %s", self.path, e)
+            return default
+
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return default
+        return value
+
+    def set(self, key: str, value: Optional[str], expire: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key
+            value: Text to store (None is stored as-is, e.g. for negative caching)
+            expire: Seconds until the entry expires (default: never)
+        """
+        expires_at = time.time() + expire if expire is not None else None
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to write cache %s: %s", self.path, e)
+
+
+@lru_cache(maxsize=None)
+def get_feed_cache(path: Path = CACHE_DIR / "feeds.pkl") -> FeedCache:
+    """Return the process-wide FeedCache for ``path`` so all scrapers share one file."""
+    return FeedCache(path)
+
+
+@lru_cache(maxsize=32)
+def parse_feed(content: bytes) -> feedparser.FeedParserDict:
+    """Parse feed bytes, reusing the previous result when a revalidated feed is unchanged."""
+    return feedparser.parse(content)
+
+
+def parse_xml(content: bytes) -> etree._Element:
+    """Parse fetched XML with entity resolution and network access disabled."""
+    # lxml parsers must not be shared between threads, so build one per call
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    return etree.fromstring(content, parser=parser)
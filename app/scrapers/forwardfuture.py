@@ -1,12 +1,20 @@
 """ForwardFuture.ai (Matthew Berman) scraper service using sitemap.xml."""
 
+import asyncio
+import logging
+import re
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import List, Optional
-from xml.etree import ElementTree
 
-import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
+from lxml import etree  # pyright: ignore[reportMissingImports]
 from pydantic import BaseModel, Field  # pyright: ignore[reportMissingImports]
 
+from app.scrapers.cache import get_feed_cache, parse_xml
+from app.scrapers.session import create_session
+
+logger = logging.getLogger(__name__)
+
 
 class ForwardFutureArticle(BaseModel):
     """Model for ForwardFuture.ai article."""
@@ -22,40 +30,67 @@ class ForwardFutureScraper:
     
     SITEMAP_URL = "https://www.forwardfuture.ai/sitemap.xml"
     
+    # Namespace-qualified (Clark notation) sitemap tags, resolved once instead of per element
+    URL_TAG = "{http://www.sitemaps.org/schemas/sitemap/0.9}url"
+    LOC_TAG = "{http://www.sitemaps.org/schemas/sitemap/0.9}loc"
+    LASTMOD_TAG = "{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod"
+    
+    # Article URLs look like https://www.forwardfuture.ai/p/article-slug
+    _SLUG_RE = re.compile(r'/p/([^/?#]+)')
+    
     def __init__(self):
         """Initialize the ForwardFuture scraper."""
-        pass
+        self._session = create_session()
+        self._feed_cache = get_feed_cache()
+    
+    def fetch_sitemap(self) -> etree._Element:
+        """Fetch and parse the sitemap.xml, revalidating a cached copy when available."""
+        content = self._feed_cache.fetch(self.SITEMAP_URL, session=self._session, timeout=10).content
+        return parse_xml(content)
     
-    def fetch_sitemap(self) -> ElementTree.Element:
-        """Fetch and parse the sitemap.xml."""
-        response = requests.get(self.SITEMAP_URL, timeout=10)
-        response.raise_for_status()
-        return ElementTree.fromstring(response.content)
+    async def fetch_sitemap_async(self) -> etree._Element:
+        """Fetch and parse the sitemap.xml without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_sitemap)
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string from sitemap (format: YYYY-MM-DD)."""
+        """Parse date string from sitemap (YYYY-MM-DD or a full ISO 8601 datetime)."""
+        date_str = date_str.strip()
         try:
-            # Sitemap dates are typically YYYY-MM-DD
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
+            dt = datetime.fromisoformat(date_str)
+        except ValueError:
+            # Unrecognized time component - fall back to just the date part
+            try:
+                dt = datetime.fromisoformat(date_str[:10])
+            except ValueError:
+                return None
+        
+        if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
-            return None
+        return dt.astimezone(timezone.utc)
     
     def _extract_title_from_url(self, url: str) -> str:
         """Extract a readable title from the URL slug."""
-        # URL format: https://www.forwardfuture.ai/p/article-slug
-        if '/p/' in url:
-            slug = url.split('/p/')[-1]
-            # Convert slug to title (replace hyphens with spaces, capitalize)
-            title = slug.replace('-', ' ').title()
-            return title
-        return url
+        match = self._SLUG_RE.search(url)
+        if match is None:
+            return url
+        # Convert slug to title (hyphens become spaces, each word capitalized).
+        # str.title() would also capitalize after apostrophes ("It'S").
+        return ' '.join(word.capitalize() for word in match.group(1).split('-'))
+    
+    def _build_article(self, url: str, published_date: Optional[datetime]) -> ForwardFutureArticle:
+        """Build an article from a sitemap URL without re-running Pydantic validation."""
+        return ForwardFutureArticle.model_construct(
+            title=self._extract_title_from_url(url),
+            url=url,
+            published_date=published_date,
+            description="",  # Can be enhanced later by fetching the page
+        )
     
     def get_articles(
         self,
         hours: int = 48,
-        max_articles_without_date: int = 10
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
     ) -> List[ForwardFutureArticle]:
         """
         Get articles from ForwardFuture.ai sitemap within the specified time window.
@@ -63,23 +98,58 @@ class ForwardFutureScraper:
         Args:
             hours: Number of hours to look back (default: 48)
             max_articles_without_date: Maximum number of articles without dates to include
+            limit: Maximum number of articles to return, most recent first (default: all)
             
         Returns:
             List of ForwardFutureArticle models within the time window, sorted by date
         """
+        try:
+            root = self.fetch_sitemap()
+        except Exception as e:
+            logger.error("Error fetching ForwardFuture sitemap: %s", e)
+            return []
+        return self._collect_articles(root, hours, max_articles_without_date, limit)
+    
+    async def get_articles_async(
+        self,
+        hours: int = 48,
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
+    ) -> List[ForwardFutureArticle]:
+        """
+        Async variant of get_articles that fetches the sitemap without blocking the event loop.
+        
+        Args:
+            hours: Number of hours to look back (default: 48)
+            max_articles_without_date: Maximum number of articles without dates to include
+            limit: Maximum number of articles to return, most recent first (default: all)
+            
+        Returns:
+            List of ForwardFutureArticle models within the time window, sorted by date
+        """
+        try:
+            root = await self.fetch_sitemap_async()
+        except Exception as e:
+            logger.error("Error fetching ForwardFuture sitemap: %s", e)
+            return []
+        return self._collect_articles(root, hours, max_articles_without_date, limit)
+    
+    def _collect_articles(
+        self,
+        root: etree._Element,
+        hours: int,
+        max_articles_without_date: int,
+        limit: Optional[int] = None
+    ) -> List[ForwardFutureArticle]:
+        """Filter sitemap URLs by time and build sorted articles."""
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        articles = []
+        dated_urls = []
         articles_without_date = []
         
         try:
-            root = self.fetch_sitemap()
-            
-            # Parse sitemap namespace
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-            
-            for url_elem in root.findall('.//ns:url', namespace):
-                loc_elem = url_elem.find('ns:loc', namespace)
-                lastmod_elem = url_elem.find('ns:lastmod', namespace)
+            for url_elem in root.iter(self.URL_TAG):
+                loc_elem = url_elem.find(self.LOC_TAG)
+                lastmod_elem = url_elem.find(self.LASTMOD_TAG)
                 
                 if loc_elem is None:
                     continue
@@ -89,7 +159,7 @@ class ForwardFutureScraper:
                     continue
                 
                 # Only process article URLs (those with /p/ prefix)
-                if '/p/' not in url:
+                if self._SLUG_RE.search(url) is None:
                     continue
                 
                 # Parse date
@@ -97,51 +167,35 @@ class ForwardFutureScraper:
                 if lastmod_elem is not None and lastmod_elem.text:
                     published_date = self._parse_date(lastmod_elem.text)
                 
-                # Filter by time if date is available
                 if published_date:
-                    now = datetime.now(timezone.utc)
-                    # If date is more than 1 day in the future, it's likely incorrect - include it
-                    if published_date > now + timedelta(days=1):
-                        pass  # Include future dates
-                    elif published_date < cutoff_time:
-                        continue  # Skip old articles
-                else:
-                    # No date available - collect separately
-                    articles_without_date.append((url, published_date))
-                    continue
-                
-                # Extract title from URL
-                title = self._extract_title_from_url(url)
-                
-                article = ForwardFutureArticle(
-                    title=title,
-                    url=url,
-                    published_date=published_date,
-                    description="",  # Can be enhanced later by fetching the page
-                )
-                articles.append(article)
+                    dated_urls.append((published_date, url))
+                elif len(articles_without_date) < max_articles_without_date:
+                    # No date available - collect separately, only up to the limit
+                    articles_without_date.append(url)
+            
+            # Walk dated URLs newest first so the first one past the cutoff ends the scan
+            dated_urls.sort(key=itemgetter(0), reverse=True)
+            
+            articles = []
+            for published_date, url in dated_urls:
+                # Future dates (likely incorrect) sort first and are always included
+                if published_date < cutoff_time:
+                    break  # Every remaining URL is older
+                if limit is not None and len(articles) >= limit:
+                    break  # Already have the most recent `limit` articles
+                articles.append(self._build_article(url, published_date))
             
-            # Add articles without dates (limit to most recent ones)
-            for url, _ in articles_without_date[:max_articles_without_date]:
-                title = self._extract_title_from_url(url)
-                article = ForwardFutureArticle(
-                    title=title,
-                    url=url,
-                    published_date=None,
-                    description="",
-                )
-                articles.append(article)
+            # Add articles without dates (already limited to the first ones listed)
+            for url in articles_without_date:
+                articles.append(self._build_article(url, None))
             
         except Exception as e:
-            print(f"Error fetching ForwardFuture sitemap: {e}")
+            logger.error("Error parsing ForwardFuture sitemap: %s", e, exc_info=True)
             return []
         
-        # Sort by published_date (most recent first)
-        articles.sort(
-            key=lambda x: x.published_date or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True
-        )
-        
+        # Already ordered most recent first, with undated articles last
+        if limit is not None:
+            return articles[:limit]
         return articles
 
 
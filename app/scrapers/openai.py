@@ -1,12 +1,23 @@
 """OpenAI blog/news scraper service using RSS feed."""
 
+import asyncio
+import heapq
+import logging
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Optional
 
 import feedparser  # pyright: ignore[reportMissingImports]
-import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
 from pydantic import BaseModel, Field  # pyright: ignore[reportMissingImports]
 
+from app.scrapers.cache import get_feed_cache, parse_feed
+from app.scrapers.session import create_session
+
+logger = logging.getLogger(__name__)
+
+# Sort key for articles without a date, so they order after dated ones
+_MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
+
 
 class OpenAIArticle(BaseModel):
     """Model for OpenAI blog article."""
@@ -24,50 +35,58 @@ class OpenAIScraper:
     
     def __init__(self):
         """Initialize the OpenAI scraper."""
-        pass
+        self._session = create_session()
+        self._feed_cache = get_feed_cache()
     
     def fetch_rss_feed(self) -> feedparser.FeedParserDict:
-        """Fetch and parse the RSS feed."""
-        response = requests.get(self.RSS_FEED_URL, timeout=10)
-        response.raise_for_status()
-        return feedparser.parse(response.content)
+        """Fetch and parse the RSS feed, revalidating a cached copy when available."""
+        cached = self._feed_cache.fetch(self.RSS_FEED_URL, session=self._session, timeout=10)
+        return parse_feed(cached.content)
+    
+    async def fetch_rss_feed_async(self) -> feedparser.FeedParserDict:
+        """Fetch and parse the RSS feed without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_rss_feed)
     
     def _parse_published_date(self, entry) -> Optional[datetime]:
         """Parse published date from RSS feed entry."""
         try:
             # Try published_parsed first (most reliable)
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                dt = datetime(*entry.published_parsed[:6])
+            published_parsed = entry.get('published_parsed')
+            if published_parsed:
+                dt = datetime(*published_parsed[:6])
                 dt = dt.replace(tzinfo=timezone.utc)
                 return dt
             
             # Fallback to updated_parsed
-            if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                dt = datetime(*entry.updated_parsed[:6])
+            updated_parsed = entry.get('updated_parsed')
+            if updated_parsed:
+                dt = datetime(*updated_parsed[:6])
                 dt = dt.replace(tzinfo=timezone.utc)
                 return dt
             
-            # Try parsing published string directly using feedparser's parse function
-            if hasattr(entry, 'published') and entry.published:
+            # Try parsing the published string directly as an RFC 2822 date
+            published = entry.get('published')
+            if published:
                 try:
-                    # Re-parse just the date string
-                    temp_feed = feedparser.parse(f'<rss><channel><item><pubDate>{entry.published}</pubDate></item></channel></rss>')
-                    if temp_feed.entries and hasattr(temp_feed.entries[0], 'published_parsed'):
-                        parsed = temp_feed.entries[0].published_parsed
-                        if parsed:
-                            dt = datetime(*parsed[:6])
-                            dt = dt.replace(tzinfo=timezone.utc)
-                            return dt
-                except Exception:
+                    dt = parsedate_to_datetime(published)
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=timezone.utc)
+                    return dt.astimezone(timezone.utc)
+                except (TypeError, ValueError):
                     pass
             
             return None
         except Exception as e:
             # Log parsing errors for debugging
-            print(f"Warning: Failed to parse date for entry: {e}")
+            logger.warning("Failed to parse date for entry: %s", e, exc_info=True)
             return None
     
-    def get_articles(self, hours: int = 24, max_articles_without_date: int = 10) -> List[OpenAIArticle]:
+    def get_articles(
+        self,
+        hours: int = 24,
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
+    ) -> List[OpenAIArticle]:
         """
         Get articles from OpenAI RSS feed within the specified time window.
         
@@ -75,12 +94,59 @@ class OpenAIScraper:
             hours: Number of hours to look back (default: 24)
             max_articles_without_date: Maximum number of articles without dates to include
                                       (RSS feeds show recent first, so limit to avoid old articles)
+            limit: Maximum number of articles to return, most recent first (default: all)
             
         Returns:
             List of OpenAIArticle models within the time window
         """
         feed = self.fetch_rss_feed()
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return self._collect_articles(feed, hours, max_articles_without_date, limit)
+    
+    async def get_articles_async(
+        self,
+        hours: int = 24,
+        max_articles_without_date: int = 10,
+        limit: Optional[int] = None
+    ) -> List[OpenAIArticle]:
+        """
+        Async variant of get_articles that fetches the feed without blocking the event loop.
+        
+        Args:
+            hours: Number of hours to look back (default: 24)
+            max_articles_without_date: Maximum number of articles without dates to include
+            limit: Maximum number of articles to return, most recent first (default: all)
+            
+        Returns:
+            List of OpenAIArticle models within the time window
+        """
+        feed = await self.fetch_rss_feed_async()
+        return self._collect_articles(feed, hours, max_articles_without_date, limit)
+    
+    def _build_article(self, entry: feedparser.FeedParserDict, published_date: Optional[datetime]) -> OpenAIArticle:
+        """
+        Build an article from a feed entry without re-running Pydantic validation.
+        
+        Fields are normalized to the model's types here, so model_construct is safe to use.
+        """
+        return OpenAIArticle.model_construct(
+            title=str(entry.title),
+            url=str(entry.link),
+            published_date=published_date,
+            description=entry.get('description') or '',
+        )
+    
+    def _collect_articles(
+        self,
+        feed: feedparser.FeedParserDict,
+        hours: int,
+        max_articles_without_date: int,
+        limit: Optional[int] = None
+    ) -> List[OpenAIArticle]:
+        """Filter entries of an already-fetched feed by time and build sorted articles."""
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=hours)
+        # Dates more than 1 day in the future are likely incorrect - they are kept rather than dropped
+        future_cutoff = now + timedelta(days=1)
         
         articles = []
         articles_without_date = []
@@ -90,9 +156,8 @@ class OpenAIScraper:
             
             # Filter by time if published_date is available and valid
             if published_date:
-                now = datetime.now(timezone.utc)
                 # If date is more than 1 day in the future, it's likely incorrect - include it
-                if published_date > now + timedelta(days=1):
+                if published_date > future_cutoff:
                     # Future date, likely incorrect - treat as recent and include
                     pass
                 elif published_date < cutoff_time:
@@ -100,30 +165,22 @@ class OpenAIScraper:
                     continue
             else:
                 # No date available - RSS feeds typically show recent articles first
-                # We'll collect these separately and limit them
-                articles_without_date.append(entry)
+                # We'll collect these separately, only up to the limit
+                if len(articles_without_date) < max_articles_without_date:
+                    articles_without_date.append(entry)
                 continue
             
-            article = OpenAIArticle(
-                title=entry.title,
-                url=entry.link,
-                published_date=published_date,
-                description=getattr(entry, 'description', ''),
-            )
-            articles.append(article)
+            articles.append(self._build_article(entry, published_date))
         
-        # Add articles without dates (limit to most recent ones)
-        for entry in articles_without_date[:max_articles_without_date]:
-            article = OpenAIArticle(
-                title=entry.title,
-                url=entry.link,
-                published_date=None,
-                description=getattr(entry, 'description', ''),
-            )
-            articles.append(article)
+        # Add articles without dates (already limited to the most recent ones)
+        for entry in articles_without_date:
+            articles.append(self._build_article(entry, None))
         
         # Sort by published_date (most recent first)
-        articles.sort(key=lambda x: x.published_date or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+        if limit is not None:
+            # Partial selection is O(n log k) instead of sorting everything
+            return heapq.nlargest(limit, articles, key=lambda x: x.published_date or _MIN_DT)
+        articles.sort(key=lambda x: x.published_date or _MIN_DT, reverse=True)
         
         return articles
 
@@ -0,0 +1,50 @@
+"""HTTP session setup shared by the scrapers."""
+
+from typing import Collection, Optional
+
+import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
+from requests.adapters import HTTPAdapter  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
+from urllib3.util.retry import Retry  # pyright: ignore[reportMissingImports]
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def create_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 16,
+    retries: int = 2,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[Collection[int]] = None,
+) -> requests.Session:
+    """
+    Create a requests.Session with connection pooling, retries and a default User-Agent.
+
+    Reusing one session keeps TCP/TLS connections alive across requests to the same host.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep (default: 4)
+        pool_maxsize: Maximum connections kept per host, i.e. concurrent requests (default: 16)
+        retries: Total retries for connection errors and ``status_forcelist`` responses (default: 2)
+        backoff_factor: Exponential backoff factor between retries in seconds (default: 0.3)
+        status_forcelist: HTTP status codes that should also be retried (default: none)
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
@@ -1,46 +1,174 @@
 """YouTube scraper service for fetching videos from RSS feeds and extracting transcripts."""
 
+import asyncio
+import json
+import logging
+import os
+import random
 import re
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlparse, parse_qs
 
-import feedparser  # pyright: ignore[reportMissingImports]
 import requests  # pyright: ignore[reportMissingImports,reportMissingModuleSource]
-from pydantic import BaseModel, Field  # pyright: ignore[reportMissingImports]
 from youtube_transcript_api import (  # pyright: ignore[reportMissingImports]
     YouTubeTranscriptApi,
     TranscriptsDisabled,
     NoTranscriptFound,
+    RequestBlocked,
+    YouTubeRequestFailed,
 )
 
+from app.scrapers.cache import CACHE_DIR, SQLiteCache, get_feed_cache, parse_xml
+from app.scrapers.session import create_session
 
-class Transcript(BaseModel):
+logger = logging.getLogger(__name__)
+
+# Transient transcript failures worth retrying: throttling (429 surfaces as IpBlocked, a
+# RequestBlocked subclass), other failed YouTube requests, and connection errors.
+# TranscriptsDisabled / NoTranscriptFound are terminal and are never retried.
+_RETRYABLE_TRANSCRIPT_ERRORS = (
+    RequestBlocked,
+    YouTubeRequestFailed,
+    requests.exceptions.RequestException,
+)
+
+# Sentinel telling a transcript cache miss apart from a cached "no transcript" (None)
+_MISSING = object()
+
+# Characters allowed in a channel ID after its "UC" prefix
+_CHANNEL_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+# Patterns are compiled once at import instead of going through re's cache on every call
+_CHANNEL_URL_RE = re.compile(r'/channel/([a-zA-Z0-9_-]+)')
+# Handles may contain periods and non-ASCII letters, so take the whole path segment
+_HANDLE_URL_RE = re.compile(r'youtube\.com/@([^/?#]+)')
+_VIDEO_ID_RE = re.compile(r'[?&]v=([a-zA-Z0-9_-]+)')
+_CHANNEL_ID_JSON_RE = re.compile(r'"channelId":"([^"]+)"')
+_CANONICAL_RE = re.compile(r'<link rel="canonical" href="https://www\.youtube\.com/channel/([^"]+)"')
+
+
+@lru_cache(maxsize=1024)
+def _parse_published_date(date_string: Optional[str]) -> Optional[datetime]:
+    """
+    Parse published date string to a canonical UTC datetime.
+    
+    Dates are normalized here, once at ingest, so everything downstream can compare them
+    directly. YouTube's feed always uses RFC 3339 (e.g. "2024-01-01T12:00:00+00:00"), which
+    fromisoformat parses directly. Results are memoized, as the same dates recur across
+    channels and repeated runs, and datetimes are immutable so sharing them is safe.
+    
+    Args:
+        date_string: Date string from the feed's published element
+        
+    Returns:
+        Timezone-aware datetime object in UTC or None if parsing fails
+    """
+    if not date_string:
+        return None
+    try:
+        dt = datetime.fromisoformat(date_string)
+    except ValueError:
+        return None
+    # A date without an offset is taken as UTC rather than local time
+    return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+# Plain slotted dataclasses: these are only passed from the scraper to the aggregator,
+# so per-field validation would be pure overhead on every feed entry
+@dataclass(slots=True)
+class Transcript:
     """Model for video transcript."""
     
-    text: str = Field(..., description="The transcript text content")
+    text: str  # The transcript text content
 
 
-class ChannelVideo(BaseModel):
+@dataclass(slots=True)
+class ChannelVideo:
     """Model for YouTube channel video."""
     
-    title: str = Field(..., description="Video title")
-    link: str = Field(..., description="Video URL")
-    video_id: Optional[str] = Field(None, description="YouTube video ID")
-    published_date: Optional[datetime] = Field(None, description="Video publication date")
-    description: str = Field(default="", description="Video description")
-    channel_id: str = Field(..., description="YouTube channel ID")
-    transcript: Optional[Transcript] = Field(None, description="Video transcript if available")
+    title: str  # Video title
+    link: str  # Video URL
+    channel_id: str  # YouTube channel ID
+    video_id: Optional[str] = None  # YouTube video ID
+    published_date: Optional[datetime] = None  # Video publication date
+    description: str = ""  # Video description
+    transcript: Optional[Transcript] = None  # Video transcript if available
 
 
 class YouTubeScraper:
     """Service to scrape YouTube channels via RSS feeds and extract video transcripts."""
 
     RSS_FEED_BASE_URL = "https://www.youtube.com/feeds/videos.xml?channel_id="
+    
+    # Namespace-qualified (Clark notation) tags of the fields read from YouTube's Atom feed
+    ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+    TITLE_TAG = "{http://www.w3.org/2005/Atom}title"
+    LINK_TAG = "{http://www.w3.org/2005/Atom}link"
+    PUBLISHED_TAG = "{http://www.w3.org/2005/Atom}published"
+    VIDEO_ID_TAG = "{http://www.youtube.com/xml/schemas/2015}videoId"
+    DESCRIPTION_PATH = "{http://search.yahoo.com/mrss/}group/{http://search.yahoo.com/mrss/}description"
+    
+    # Concurrent transcript fetches per channel
+    TRANSCRIPT_MAX_WORKERS = 10
+    
+    # Transcript attempts per video, with exponential backoff plus jitter between them (seconds)
+    TRANSCRIPT_RETRY_ATTEMPTS = 4
+    TRANSCRIPT_RETRY_INITIAL_DELAY = 1.0
+    TRANSCRIPT_RETRY_MAX_DELAY = 10.0
+    
+    # How long fetched transcripts, and videos known to have none, are served from the cache
+    TRANSCRIPT_CACHE_TTL = 30 * 24 * 60 * 60
+    MISSING_TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60
+    
+    # Resolved handle -> channel ID mappings, persisted across runs
+    HANDLE_CACHE_PATH = CACHE_DIR / "handles.json"
+    
+    # Bytes read per step while scanning a channel page for its ID
+    HANDLE_PAGE_CHUNK_SIZE = 16384
 
     def __init__(self):
         """Initialize the YouTube scraper."""
-        pass
+        self._handle_cache_lock = threading.Lock()
+        self._handle_cache: Dict[str, str] = self._load_handle_cache()
+        # One pooled session for every youtube.com request; YouTube throttles with 429s,
+        # so those are retried with backoff along with transient server errors
+        self._session = create_session(
+            pool_connections=16,
+            pool_maxsize=16,
+            retries=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self._feed_cache = get_feed_cache()
+        self._transcript_cache = SQLiteCache(CACHE_DIR / "transcripts.sqlite")
+
+    def _load_handle_cache(self) -> Dict[str, str]:
+        """Load persisted handle mappings, starting empty if the file is missing or unreadable."""
+        try:
+            with open(self.HANDLE_CACHE_PATH, encoding="utf-8") as f:
+                mappings = json.load(f)
+            return mappings if isinstance(mappings, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_handle_cache(self) -> None:
+        """Atomically persist the handle mappings. Must be called with the lock held."""
+        path = self.HANDLE_CACHE_PATH
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._handle_cache, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write handle cache %s: %s", path, e)
 
     def extract_channel_id(self, channel_identifier: str) -> Optional[str]:
         """
@@ -59,27 +187,26 @@ class YouTubeScraper:
             Channel ID string or None if extraction fails
         """
         # If it's already a channel ID (starts with UC and is 24 chars)
-        if re.match(r'^UC[a-zA-Z0-9_-]{22}$', channel_identifier):
+        if (
+            len(channel_identifier) == 24
+            and channel_identifier.startswith('UC')
+            and _CHANNEL_ID_CHARS.issuperset(channel_identifier[2:])
+        ):
             return channel_identifier
         
-        # If it's a channel URL
-        if 'youtube.com/channel/' in channel_identifier:
-            match = re.search(r'/channel/([a-zA-Z0-9_-]+)', channel_identifier)
-            if match:
-                return match.group(1)
+        # If it's a channel URL - each pattern is searched once, with no substring precheck
+        match = _CHANNEL_URL_RE.search(channel_identifier)
+        if match:
+            return match.group(1)
         
         # If it's a custom handle URL or handle
+        # For custom handles, we need to resolve them to channel ID
+        # This requires fetching the page or using YouTube Data API
+        match = _HANDLE_URL_RE.search(channel_identifier)
+        if match:
+            return self._resolve_handle_to_channel_id(match.group(1))
         if '@' in channel_identifier:
-            # For custom handles, we need to resolve them to channel ID
-            # This requires fetching the page or using YouTube Data API
-            # For now, we'll try to extract from URL or return None
-            if 'youtube.com/@' in channel_identifier:
-                handle = re.search(r'@([a-zA-Z0-9_-]+)', channel_identifier).group(1)
-            else:
-                handle = channel_identifier.lstrip('@')
-            
-            # Try to resolve handle to channel ID via page scraping
-            return self._resolve_handle_to_channel_id(handle)
+            return self._resolve_handle_to_channel_id(channel_identifier.lstrip('@'))
         
         return None
 
@@ -87,30 +214,68 @@ class YouTubeScraper:
         """
         Resolve a YouTube handle to channel ID by scraping the channel page.
         
+        A handle's channel ID does not change, so successful resolutions are cached in
+        memory and on disk and the page is only fetched the first time a handle is seen.
+        Failures are not cached and are retried on the next call.
+        
         Args:
             handle: YouTube handle (without @)
             
         Returns:
             Channel ID or None if resolution fails
         """
+        with self._handle_cache_lock:
+            channel_id = self._handle_cache.get(handle)
+        if channel_id:
+            return channel_id
+        
+        channel_id = self._fetch_channel_id_for_handle(handle)
+        if channel_id:
+            # Logged so the ID can be pinned in YOUTUBE_CHANNELS instead of the handle
+            logger.info("Resolved @%s -> %s", handle, channel_id)
+            with self._handle_cache_lock:
+                self._handle_cache[handle] = channel_id
+                self._save_handle_cache()
+        return channel_id
+
+    def _fetch_channel_id_for_handle(self, handle: str) -> Optional[str]:
+        """
+        Fetch the channel page for a handle and extract its channel ID.
+        
+        Args:
+            handle: YouTube handle (without @)
+            
+        Returns:
+            Channel ID or None if it could not be found
+        """
         try:
             url = f"https://www.youtube.com/@{handle}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Look for channel ID in the page source
-            # YouTube embeds the channel ID in various places in the HTML
-            match = re.search(r'"channelId":"([^"]+)"', response.text)
-            if match:
-                return match.group(1)
+            # Stream the page: the channel ID is usually near the top, so most of the
+            # body never has to be downloaded
+            with self._session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = "utf-8"
+                
+                # Look for channel ID in the page source
+                # YouTube embeds the channel ID in various places in the HTML
+                chunks = []
+                previous = ""
+                for chunk in response.iter_content(chunk_size=self.HANDLE_PAGE_CHUNK_SIZE, decode_unicode=True):
+                    # Search the previous chunk too, to catch a match split across the boundary
+                    match = _CHANNEL_ID_JSON_RE.search(previous + chunk)
+                    if match:
+                        return match.group(1)
+                    chunks.append(chunk)
+                    previous = chunk
             
             # Alternative pattern
-            match = re.search(r'<link rel="canonical" href="https://www\.youtube\.com/channel/([^"]+)"', response.text)
+            match = _CANONICAL_RE.search("".join(chunks))
             if match:
                 return match.group(1)
                 
         except Exception as e:
-            print(f"Error resolving handle {handle} to channel ID: {e}")
+            logger.error("Error resolving handle %s to channel ID: %s", handle, e)
         
         return None
 
@@ -126,12 +291,20 @@ class YouTubeScraper:
         """
         return f"{self.RSS_FEED_BASE_URL}{channel_id}"
 
-    def fetch_videos_from_rss(self, channel_id: str) -> List[ChannelVideo]:
+    def fetch_videos_from_rss(
+        self,
+        channel_id: str,
+        cutoff: Optional[datetime] = None
+    ) -> List[ChannelVideo]:
         """
         Fetch videos from YouTube RSS feed for a given channel.
         
+        The feed lists videos newest first, so when ``cutoff`` is given reading stops at
+        the first video published before it.
+        
         Args:
             channel_id: YouTube channel ID
+            cutoff: Only return videos published at or after this time (default: all videos)
             
         Returns:
             List of ChannelVideo models with title, link, video_id, published_date, description
@@ -139,51 +312,45 @@ class YouTubeScraper:
         rss_url = self.get_rss_feed_url(channel_id)
         
         try:
-            # Fetch RSS feed using requests first to validate response
-            response = requests.get(rss_url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
-            
-            # Check if we got valid XML/RSS content
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'xml' not in content_type and 'rss' not in content_type and 'atom' not in content_type:
-                # Still try to parse, as some feeds don't set content-type correctly
-                pass
+            # Fetch RSS feed, revalidating a cached copy with ETag / Last-Modified when available
+            cached = self._feed_cache.fetch(rss_url, session=self._session, timeout=10)
             
-            # Parse the RSS feed content
-            feed = feedparser.parse(response.content)
-            
-            # Check for parsing errors
-            if feed.bozo:
-                error_msg = str(feed.bozo_exception) if feed.bozo_exception else "Unknown parsing error"
-                # Some bozo errors are non-fatal (like missing DTD), check if we have entries
-                if not feed.entries:
-                    raise Exception(f"RSS feed parsing error: {error_msg}")
+            # Parse the Atom feed directly - YouTube's schema is fixed and the fields read
+            # here are plain text, so feedparser's sanitizing and URI resolution are not needed
+            root = parse_xml(cached.content)
+            entries = root.findall(self.ENTRY_TAG)
             
             # Check if feed has entries
-            if not feed.entries:
-                print(f"No videos found in RSS feed for channel {channel_id}")
+            if not entries:
+                logger.info("No videos found in RSS feed for channel %s", channel_id)
                 return []
             
             videos = []
-            for entry in feed.entries:
-                # Extract video ID from link or yt_videoid
-                video_id = None
-                if hasattr(entry, 'yt_videoid'):
-                    video_id = entry.yt_videoid
-                else:
+            for entry in entries:
+                published_date = _parse_published_date(entry.findtext(self.PUBLISHED_TAG))
+                if cutoff is not None:
+                    if published_date is None:
+                        continue
+                    if published_date < cutoff:
+                        break
+                
+                link_elem = entry.find(self.LINK_TAG)
+                link = link_elem.get('href', '') if link_elem is not None else ''
+                
+                # Extract video ID from yt:videoId or the link
+                video_id = entry.findtext(self.VIDEO_ID_TAG)
+                if not video_id:
                     # Extract from link: https://www.youtube.com/watch?v=VIDEO_ID
-                    match = re.search(r'[?&]v=([a-zA-Z0-9_-]+)', entry.link)
+                    match = _VIDEO_ID_RE.search(link)
                     if match:
                         video_id = match.group(1)
                 
                 video = ChannelVideo(
-                    title=entry.title,
-                    link=entry.link,
+                    title=entry.findtext(self.TITLE_TAG, ''),
+                    link=link,
                     video_id=video_id,
-                    published_date=self._parse_published_date(entry.published),
-                    description=getattr(entry, 'summary', ''),
+                    published_date=published_date,
+                    description=entry.findtext(self.DESCRIPTION_PATH, ''),
                     channel_id=channel_id,
                     transcript=None,
                 )
@@ -192,54 +359,15 @@ class YouTubeScraper:
             return videos
             
         except requests.exceptions.HTTPError as e:
-            print(f"HTTP error fetching RSS feed for channel {channel_id}: {e}")
-            print(f"URL: {rss_url}")
+            logger.error("HTTP error fetching RSS feed for channel %s (%s): %s", channel_id, rss_url, e)
             return []
         except requests.exceptions.RequestException as e:
-            print(f"Request error fetching RSS feed for channel {channel_id}: {e}")
+            logger.error("Request error fetching RSS feed for channel %s: %s", channel_id, e)
             return []
         except Exception as e:
-            print(f"Error fetching RSS feed for channel {channel_id}: {e}")
+            logger.error("Error fetching RSS feed for channel %s: %s", channel_id, e)
             return []
 
-    def _parse_published_date(self, date_string: str) -> Optional[datetime]:
-        """
-        Parse published date string to datetime object.
-        
-        Args:
-            date_string: Date string from RSS feed (can be struct_time or string)
-            
-        Returns:
-            Timezone-aware datetime object in UTC or None if parsing fails
-        """
-        try:
-            # feedparser provides parsed time as a time.struct_time
-            # Check if it's a struct_time object
-            if hasattr(date_string, 'timetuple'):
-                # feedparser's parsed dates are timezone-aware
-                # Convert to UTC datetime
-                dt = datetime(*date_string.timetuple()[:6])
-                # If the struct_time has timezone info, use it
-                if hasattr(date_string, 'tzinfo') and date_string.tzinfo:
-                    dt = dt.replace(tzinfo=date_string.tzinfo)
-                    return dt.astimezone(timezone.utc)
-                # Otherwise, assume UTC
-                return dt.replace(tzinfo=timezone.utc)
-            
-            # Try parsing as string
-            try:
-                dt = datetime.strptime(date_string, '%a, %d %b %Y %H:%M:%S %Z')
-                # If no timezone info, assume UTC
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.astimezone(timezone.utc)
-            except ValueError:
-                # Try ISO format
-                dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-                return dt.astimezone(timezone.utc)
-        except Exception:
-            return None
-
     def filter_videos_by_time(
         self, 
         videos: List[ChannelVideo], 
@@ -255,30 +383,18 @@ class YouTubeScraper:
         Returns:
             Filtered list of ChannelVideo models
         """
-        # Use timezone-aware UTC datetime
+        # published_date is already normalized to UTC when the feed is parsed
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        
-        filtered = []
-        for video in videos:
-            published_date = video.published_date
-            if published_date:
-                # Ensure published_date is timezone-aware
-                if published_date.tzinfo is None:
-                    # Assume UTC if naive
-                    published_date = published_date.replace(tzinfo=timezone.utc)
-                else:
-                    # Convert to UTC if timezone-aware
-                    published_date = published_date.astimezone(timezone.utc)
-                
-                if published_date >= cutoff_time:
-                    filtered.append(video)
-        
-        return filtered
+        return [video for video in videos if video.published_date and video.published_date >= cutoff_time]
 
     def get_video_transcript(self, video_id: str, languages: Optional[List[str]] = None) -> Optional[Transcript]:
         """
         Get transcript for a YouTube video.
         
+        Throttled or failed requests are retried with backoff before giving up. Results are
+        cached on disk, including videos without a transcript, which are re-checked after a
+        week; transient failures are not cached.
+        
         Args:
             video_id: YouTube video ID
             languages: Preferred languages (default: ['en'] for English)
@@ -289,52 +405,90 @@ class YouTubeScraper:
         if languages is None:
             languages = ['en']
         
+        cache_key = f"{video_id}@{','.join(languages)}"
+        cached = self._transcript_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return Transcript(text=cached) if cached is not None else None
+        
         try:
-            # Create API instance and get list of available transcripts
-            yt_api = YouTubeTranscriptApi()
-            transcript_list = yt_api.list(video_id)
-            
-            # Try to get transcript in preferred language
-            transcript_obj = None
-            for lang in languages:
-                try:
-                    transcript_obj = transcript_list.find_transcript([lang])
-                    break
-                except Exception:
-                    continue
-            
-            # If no preferred language found, try to get any manually created transcript
-            if transcript_obj is None:
-                try:
-                    transcript_obj = transcript_list.find_manually_created_transcript(languages)
-                except Exception:
-                    # If no manually created transcript, get the first available (auto-generated)
-                    try:
-                        transcript_obj = transcript_list.find_generated_transcript(languages)
-                    except Exception:
-                        # Last resort: get any available transcript
-                        available_transcripts = list(transcript_list)
-                        if available_transcripts:
-                            transcript_obj = available_transcripts[0]
-            
-            if transcript_obj is None:
-                print(f"No transcript available for video {video_id}")
-                return None
-            
-            # Fetch the actual transcript
-            transcript_data = transcript_obj.fetch()
-            
-            # Combine all text segments (transcript_data contains FetchedTranscriptSnippet objects)
-            transcript_text = ' '.join([item.text for item in transcript_data])
-            
-            return Transcript(text=transcript_text)
-            
+            transcript = self._fetch_transcript_with_retry(video_id, languages)
         except (TranscriptsDisabled, NoTranscriptFound) as e:
-            print(f"Transcript not available for video {video_id}: {e}")
-            return None
+            logger.info("Transcript not available for video %s: %s", video_id, e)
+            transcript = None
         except Exception as e:
-            print(f"Error fetching transcript for video {video_id}: {e}")
+            logger.error("Error fetching transcript for video %s: %s", video_id, e)
             return None
+        
+        if transcript is not None:
+            self._transcript_cache.set(cache_key, transcript.text, expire=self.TRANSCRIPT_CACHE_TTL)
+        else:
+            self._transcript_cache.set(cache_key, None, expire=self.MISSING_TRANSCRIPT_CACHE_TTL)
+        return transcript
+
+    def _fetch_transcript_with_retry(self, video_id: str, languages: List[str]) -> Optional[Transcript]:
+        """
+        Fetch a transcript, retrying transient failures with exponential backoff and jitter.
+        
+        Terminal errors such as TranscriptsDisabled propagate immediately, as does the
+        last transient error once all attempts are used.
+        """
+        for attempt in range(self.TRANSCRIPT_RETRY_ATTEMPTS):
+            try:
+                return self._fetch_transcript(video_id, languages)
+            except _RETRYABLE_TRANSCRIPT_ERRORS as e:
+                if attempt == self.TRANSCRIPT_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = min(self.TRANSCRIPT_RETRY_MAX_DELAY, self.TRANSCRIPT_RETRY_INITIAL_DELAY * 2 ** attempt)
+                delay += random.uniform(0, self.TRANSCRIPT_RETRY_INITIAL_DELAY)
+                logger.warning(
+                    "Transcript request for video %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                    video_id, attempt + 1, self.TRANSCRIPT_RETRY_ATTEMPTS, delay, e,
+                )
+                time.sleep(delay)
+        return None
+
+    def _fetch_transcript(self, video_id: str, languages: List[str]) -> Optional[Transcript]:
+        """Fetch a transcript once, preferring ``languages``; API errors propagate."""
+        # Create API instance and get list of available transcripts
+        yt_api = YouTubeTranscriptApi()
+        transcript_list = yt_api.list(video_id)
+        
+        # Try to get transcript in preferred language
+        transcript_obj = None
+        for lang in languages:
+            try:
+                transcript_obj = transcript_list.find_transcript([lang])
+                break
+            except Exception:
+                continue
+        
+        # If no preferred language found, try to get any manually created transcript
+        if transcript_obj is None:
+            try:
+                transcript_obj = transcript_list.find_manually_created_transcript(languages)
+            except Exception:
+                # If no manually created transcript, get the first available (auto-generated)
+                try:
+                    transcript_obj = transcript_list.find_generated_transcript(languages)
+                except Exception:
+                    # Last resort: get any available transcript
+                    available_transcripts = list(transcript_list)
+                    if available_transcripts:
+                        transcript_obj = available_transcripts[0]
+        
+        if transcript_obj is None:
+            logger.info("No transcript available for video %s", video_id)
+            return None
+        
+        # Fetch the actual transcript
+        transcript_data = transcript_obj.fetch()
+        
+        # Combine all text segments (transcript_data contains FetchedTranscriptSnippet objects).
+        # A list comprehension on purpose: str.join materializes a generator into a list
+        # anyway, so a generator saves no memory here and is measurably slower
+        transcript_text = ' '.join([item.text for item in transcript_data])
+        
+        return Transcript(text=transcript_text)
 
     def get_latest_videos(
         self, 
@@ -356,32 +510,57 @@ class YouTubeScraper:
         # Extract channel ID
         channel_id = self.extract_channel_id(channel_identifier)
         if not channel_id:
-            print(f"Could not extract channel ID from: {channel_identifier}")
+            logger.warning("Could not extract channel ID from: %s", channel_identifier)
             return []
         
-        # Fetch all videos from RSS
-        videos = self.fetch_videos_from_rss(channel_id)
-        
-        # Filter by time
-        recent_videos = self.filter_videos_by_time(videos, hours=hours)
+        # Fetch videos from RSS, reading only as far back as the time window
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        recent_videos = self.fetch_videos_from_rss(channel_id, cutoff=cutoff)
         
         # Optionally fetch transcripts
         if include_transcripts:
-            updated_videos = []
+            video_ids = [video.video_id for video in recent_videos if video.video_id]
+            if not video_ids:
+                return recent_videos
+            
+            # Each transcript is a separate HTTP round-trip, so fetch them concurrently
+            max_workers = min(self.TRANSCRIPT_MAX_WORKERS, len(video_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                transcripts = dict(zip(video_ids, executor.map(self.get_video_transcript, video_ids)))
+            
             for video in recent_videos:
                 if video.video_id:
-                    transcript = self.get_video_transcript(video.video_id)
-                    # Update video with transcript using model_copy
-                    updated_video = video.model_copy(update={'transcript': transcript})
-                    updated_videos.append(updated_video)
-                else:
-                    updated_videos.append(video)
-            return updated_videos
+                    video.transcript = transcripts[video.video_id]
         
         return recent_videos
+    
+    async def get_latest_videos_async(
+        self,
+        channel_identifier: str,
+        hours: int = 24,
+        include_transcripts: bool = True
+    ) -> List[ChannelVideo]:
+        """
+        Async variant of get_latest_videos that runs it without blocking the event loop.
+        
+        Args:
+            channel_identifier: Channel ID, URL, or handle
+            hours: Number of hours to look back (default: 24)
+            include_transcripts: Whether to fetch transcripts (default: True)
+            
+        Returns:
+            List of ChannelVideo models with all metadata and optionally transcripts
+        """
+        return await asyncio.to_thread(
+            self.get_latest_videos,
+            channel_identifier,
+            hours=hours,
+            include_transcripts=include_transcripts,
+        )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     scraper = YouTubeScraper()
     # latest_videos = scraper.get_latest_videos("https://www.youtube.com/@Firstpost")
     latest_videos = scraper.get_latest_videos("https://www.youtube.com/@daveebbelaar")
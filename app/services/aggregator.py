@@ -1,5 +1,8 @@
 """Main aggregator service that collects content from all sources."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -10,9 +13,48 @@ from app.scrapers.forwardfuture import ForwardFutureScraper, ForwardFutureArticl
 from config.youtube_channels import YOUTUBE_CHANNELS
 
 
+@dataclass
+class AggregatedContent:
+    """Content collected from all sources in one run."""
+    
+    timestamp: datetime
+    youtube_videos: List[ChannelVideo] = field(default_factory=list)
+    anthropic_articles: List[AnthropicArticle] = field(default_factory=list)
+    openai_articles: List[OpenAIArticle] = field(default_factory=list)
+    forwardfuture_articles: List[ForwardFutureArticle] = field(default_factory=list)
+    
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of items collected from each source."""
+        return {
+            'youtube_videos': len(self.youtube_videos),
+            'anthropic_articles': len(self.anthropic_articles),
+            'openai_articles': len(self.openai_articles),
+            'forwardfuture_articles': len(self.forwardfuture_articles),
+        }
+    
+    @property
+    def total(self) -> int:
+        """Total number of items collected across all sources."""
+        return sum(self.counts.values())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the content in the dictionary shape returned by run_aggregator."""
+        return {
+            'youtube_videos': self.youtube_videos,
+            'anthropic_articles': self.anthropic_articles,
+            'openai_articles': self.openai_articles,
+            'forwardfuture_articles': self.forwardfuture_articles,
+            'timestamp': self.timestamp,
+        }
+
+
 class NewsAggregator:
     """Main service that aggregates content from all sources."""
     
+    # Concurrent YouTube channel fetches
+    YOUTUBE_MAX_WORKERS = 8
+    
     def __init__(self, hours: int = 48):
         """
         Initialize the news aggregator.
@@ -26,90 +68,104 @@ class NewsAggregator:
         self.openai_scraper = OpenAIScraper()
         self.forwardfuture_scraper = ForwardFutureScraper()
     
-    def collect_all_content(self) -> Dict[str, Any]:
+    def collect_all_content(self) -> AggregatedContent:
         """
         Collect content from all sources.
         
         Returns:
-            Dictionary containing all collected content:
-            {
-                'youtube_videos': List[ChannelVideo],
-                'anthropic_articles': List[AnthropicArticle],
-                'openai_articles': List[OpenAIArticle],
-                'forwardfuture_articles': List[ForwardFutureArticle],
-                'timestamp': datetime
-            }
+            AggregatedContent with the videos and articles from each source
         """
         print(f"Collecting content from last {self.hours} hours...")
         
-        results = {
-            'youtube_videos': [],
-            'anthropic_articles': [],
-            'openai_articles': [],
-            'forwardfuture_articles': [],
-            'timestamp': datetime.now(),
-        }
+        timestamp = datetime.now()
         
-        # Collect YouTube videos
-        if YOUTUBE_CHANNELS:
-            print(f"\nFetching videos from {len(YOUTUBE_CHANNELS)} YouTube channel(s)...")
-            for channel in YOUTUBE_CHANNELS:
+        # The site scrapers are independent network I/O, so run them in the
+        # background while the YouTube channels are being fetched
+        with ThreadPoolExecutor(max_workers=3) as site_executor:
+            anthropic_future = site_executor.submit(self.anthropic_scraper.get_articles, hours=self.hours)
+            openai_future = site_executor.submit(self.openai_scraper.get_articles, hours=self.hours)
+            forwardfuture_future = site_executor.submit(self.forwardfuture_scraper.get_articles, hours=self.hours)
+            site_futures = {
+                anthropic_future: 'Anthropic',
+                openai_future: 'OpenAI',
+                forwardfuture_future: 'ForwardFuture',
+            }
+            
+            # Collect YouTube videos
+            youtube_videos = self._collect_youtube_videos()
+            
+            # Collect Anthropic, OpenAI and ForwardFuture articles. Results are only
+            # stored from this thread, so no locking is needed
+            print("\nFetching Anthropic, OpenAI and ForwardFuture articles...")
+            articles_by_future = {}
+            for future in as_completed(site_futures):
+                name = site_futures[future]
                 try:
-                    videos = self.youtube_scraper.get_latest_videos(
-                        channel_identifier=channel,
-                        hours=self.hours,
-                        include_transcripts=False  # Set to True if you want transcripts
-                    )
-                    results['youtube_videos'].extend(videos)
-                    print(f"  ✓ Found {len(videos)} videos from {channel}")
+                    articles = future.result()
+                    articles_by_future[future] = articles
+                    print(f"  ✓ Found {len(articles)} {name} articles")
                 except Exception as e:
-                    print(f"  ✗ Error fetching from {channel}: {e}")
-        else:
-            print("No YouTube channels configured.")
-        
-        # Collect Anthropic articles
-        print("\nFetching Anthropic articles...")
-        try:
-            anthropic_articles = self.anthropic_scraper.get_articles(hours=self.hours)
-            results['anthropic_articles'] = anthropic_articles
-            print(f"  ✓ Found {len(anthropic_articles)} Anthropic articles")
-        except Exception as e:
-            print(f"  ✗ Error fetching Anthropic articles: {e}")
-        
-        # Collect OpenAI articles
-        print("\nFetching OpenAI articles...")
-        try:
-            openai_articles = self.openai_scraper.get_articles(hours=self.hours)
-            results['openai_articles'] = openai_articles
-            print(f"  ✓ Found {len(openai_articles)} OpenAI articles")
-        except Exception as e:
-            print(f"  ✗ Error fetching OpenAI articles: {e}")
+                    print(f"  ✗ Error fetching {name} articles: {e}")
         
-        # Collect ForwardFuture articles
-        print("\nFetching ForwardFuture articles...")
-        try:
-            forwardfuture_articles = self.forwardfuture_scraper.get_articles(hours=self.hours)
-            results['forwardfuture_articles'] = forwardfuture_articles
-            print(f"  ✓ Found {len(forwardfuture_articles)} ForwardFuture articles")
-        except Exception as e:
-            print(f"  ✗ Error fetching ForwardFuture articles: {e}")
+        results = AggregatedContent(
+            timestamp=timestamp,
+            youtube_videos=youtube_videos,
+            anthropic_articles=articles_by_future.get(anthropic_future, []),
+            openai_articles=articles_by_future.get(openai_future, []),
+            forwardfuture_articles=articles_by_future.get(forwardfuture_future, []),
+        )
         
         # Summary
-        total_items = (
-            len(results['youtube_videos']) +
-            len(results['anthropic_articles']) +
-            len(results['openai_articles']) +
-            len(results['forwardfuture_articles'])
-        )
+        counts = results.counts
         print(f"\n{'='*60}")
-        print(f"Total items collected: {total_items}")
-        print(f"  - YouTube videos: {len(results['youtube_videos'])}")
-        print(f"  - Anthropic articles: {len(results['anthropic_articles'])}")
-        print(f"  - OpenAI articles: {len(results['openai_articles'])}")
-        print(f"  - ForwardFuture articles: {len(results['forwardfuture_articles'])}")
+        print(f"Total items collected: {sum(counts.values())}")
+        print(f"  - YouTube videos: {counts['youtube_videos']}")
+        print(f"  - Anthropic articles: {counts['anthropic_articles']}")
+        print(f"  - OpenAI articles: {counts['openai_articles']}")
+        print(f"  - ForwardFuture articles: {counts['forwardfuture_articles']}")
         print(f"{'='*60}")
         
         return results
+    
+    def _collect_youtube_videos(self) -> List[ChannelVideo]:
+        """
+        Fetch recent videos from all configured YouTube channels concurrently.
+        
+        Returns:
+            List of ChannelVideo models, grouped by channel in configuration order
+        """
+        if not YOUTUBE_CHANNELS:
+            print("No YouTube channels configured.")
+            return []
+        
+        print(f"\nFetching videos from {len(YOUTUBE_CHANNELS)} YouTube channel(s)...")
+        videos_by_channel: Dict[str, List[ChannelVideo]] = {}
+        max_workers = min(self.YOUTUBE_MAX_WORKERS, len(YOUTUBE_CHANNELS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.youtube_scraper.get_latest_videos,
+                    channel_identifier=channel,
+                    hours=self.hours,
+                    include_transcripts=False  # Set to True if you want transcripts
+                ): channel
+                for channel in YOUTUBE_CHANNELS
+            }
+            for future in as_completed(futures):
+                channel = futures[future]
+                try:
+                    videos = future.result()
+                    videos_by_channel[channel] = videos
+                    print(f"  ✓ Found {len(videos)} videos from {channel}")
+                except Exception as e:
+                    print(f"  ✗ Error fetching from {channel}: {e}")
+        
+        # Keep a stable order regardless of which channel finished first
+        return [
+            video
+            for channel in YOUTUBE_CHANNELS
+            for video in videos_by_channel.get(channel, ())
+        ]
 
 
 def run_aggregator(hours: int = 48) -> Dict[str, Any]:
@@ -120,13 +176,22 @@ def run_aggregator(hours: int = 48) -> Dict[str, Any]:
         hours: Number of hours to look back (default: 48)
         
     Returns:
-        Dictionary with all collected content
+        Dictionary with all collected content:
+        {
+            'youtube_videos': List[ChannelVideo],
+            'anthropic_articles': List[AnthropicArticle],
+            'openai_articles': List[OpenAIArticle],
+            'forwardfuture_articles': List[ForwardFutureArticle],
+            'timestamp': datetime
+        }
     """
     aggregator = NewsAggregator(hours=hours)
-    return aggregator.collect_all_content()
+    return aggregator.collect_all_content().to_dict()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    
     # Example usage
     results = run_aggregator(hours=48)
     
@@ -1,10 +1,14 @@
 """Main entry point for the AI news aggregator."""
 
+import logging
+
 from app.services.aggregator import run_aggregator
 
 
 def main():
     """Run the news aggregator."""
+    # Show scraper INFO messages, e.g. resolved handle -> channel ID mappings to pin in config
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     # Default: collect content from last 48 hours
     results = run_aggregator(hours=48)
     return results